@@ -6,239 +6,362 @@ age, gender, education, marital_status, experience_level, employment_type,
 job_title, hours_per_week, employee_residence, company_location, remote_ratio, company_size
 """
 
+import html
 import os
+import threading
 import time
-from datetime import datetime
-from typing import Dict, Any
+from collections import deque
+from datetime import datetime, timezone
+from typing import Dict, Any, Tuple
+from urllib.parse import urlparse
 
+import orjson
 import streamlit as st
 import requests
-import plotly.graph_objects as go
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # ----------------------------
 # Config
 # ----------------------------
 BACKEND_URL = os.getenv("BACKEND_URL", "https://redemption-of-ai.onrender.com/").rstrip("/")  # e.g. https://smartpay-ai-backend.onrender.com
 API_KEY = os.getenv("API_KEY")                      # must match backend API_KEY
-PREDICT_ENDPOINT = f"{BACKEND_URL}/predict" if BACKEND_URL else None
+_backend = urlparse(BACKEND_URL)
+# validated once here so a malformed URL is reported as a config error, not a per-click network failure
+PREDICT_ENDPOINT = f"{BACKEND_URL}/predict" if _backend.scheme in ("http", "https") and _backend.netloc else None
 
-HEADERS = {"Content-Type": "application/json"}
-if API_KEY:
-    HEADERS["x-api-key"] = API_KEY
+# display labels for the remote ratio selectbox, looked up instead of formatted per option
+REMOTE_RATIO_LABELS = {0.0: "0%", 25.0: "25%", 50.0: "50%", 75.0: "75%", 100.0: "100%"}
+
+# free-text payload fields that must not be blank, mapped to their widget labels for the warning
+REQUIRED_TEXT_LABELS = {
+    "job_title": "Job Title",
+    "employee_residence": "Employee Residence (Country)",
+    "company_location": "Company Location (Country)",
+}
 
 st.set_page_config(page_title="SmartPay — Salary Intelligence", page_icon="💼", layout="wide")
 
 # ----------------------------
 # Styling
 # ----------------------------
-st.markdown(
-    """
-    <style>
-    :root{ --accent1:#0072ff; --accent2:#00c6ff; }
-    .block-container { padding-top: 18px; padding-left: 44px; padding-right: 44px; }
-    body { background: linear-gradient(135deg,#f7fbff 0%, #f1fbff 100%); color: #071a2b; font-family: Inter, system-ui, -apple-system, "Segoe UI", Roboto, Arial; }
-    .title { font-size: 44px; font-weight:800; letter-spacing:-0.02em; }
-    .subtitle { color:#6b7a86; font-size:15px; margin-bottom:26px; }
-    .glass { background: linear-gradient(180deg, rgba(255,255,255,0.98), rgba(255,255,255,0.96)); border-radius:12px; padding:24px; box-shadow: 0 12px 30px rgba(6,30,45,0.06); border:1px solid rgba(9,30,45,0.04); }
-    .big-btn { background: linear-gradient(90deg,var(--accent1),var(--accent2)); color:white; font-weight:700; border-radius:10px; padding:12px 18px; border:none; width:100%; }
-    .small-muted { color:#8b9aa6; font-size:13px; }
-    footer { color:#6b7a86; text-align:center; padding-top:24px; padding-bottom:24px; }
-    .salary-val { color:var(--accent1); font-size:40px; font-weight:800; }
-    </style>
-    """,
-    unsafe_allow_html=True,
-)
+# st.html injects the stylesheet without running it through the markdown parser
+CSS = """
+<style>
+:root{ --accent1:#0072ff; --accent2:#00c6ff; }
+.block-container { padding-top: 18px; padding-left: 44px; padding-right: 44px; }
+body { background: linear-gradient(135deg,#f7fbff 0%, #f1fbff 100%); font-family: Inter, system-ui, -apple-system, "Segoe UI", Roboto, Arial; }
+.title { font-size: 44px; font-weight:800; letter-spacing:-0.02em; }
+.subtitle { color:#6b7a86; font-size:15px; margin-bottom:26px; }
+.glass { background: linear-gradient(180deg, rgba(255,255,255,0.98), rgba(255,255,255,0.96)); border-radius:12px; padding:24px; box-shadow: 0 12px 30px rgba(6,30,45,0.06); border:1px solid rgba(9,30,45,0.04); }
+.small-muted { color:#8b9aa6; font-size:13px; }
+footer { color:#6b7a86; text-align:center; padding-top:24px; padding-bottom:24px; }
+.salary-val { color:var(--accent1); font-size:40px; font-weight:800; }
+.history-entry { border:1px solid rgba(9,30,45,0.08); border-radius:10px; padding:10px 14px; margin-bottom:8px; }
+.history-entry summary { cursor:pointer; font-weight:600; }
+.profile-grid { display:grid; grid-template-columns:1fr 1fr; gap:12px; margin-top:12px; }
+.salary-icon { width:64px; height:64px; border-radius:50%; margin-bottom:10px; box-shadow:0 8px 22px rgba(0,114,255,0.12);
+  background: url("data:image/svg+xml,%3Csvg xmlns='http://www.w3.org/2000/svg' viewBox='0 0 24 24' fill='none'%3E%3Cpath d='M3 17h4l5-9 5 7 4-11' stroke='white' stroke-width='1.6' stroke-linecap='round' stroke-linejoin='round'/%3E%3C/svg%3E") center / 28px 28px no-repeat, linear-gradient(135deg,#0072ff,#00c6ff); }
+</style>
+"""
+
+st.html(CSS)
 
 # ----------------------------
 # Header / Hero
 # ----------------------------
-st.markdown(f"<div class='title'>Discover Your <span style='background:linear-gradient(90deg,#0072ff,#00c6ff); -webkit-background-clip:text; -webkit-text-fill-color:transparent'>Salary Potential</span></div>", unsafe_allow_html=True)
-st.markdown("<div class='subtitle'>Get accurate salary predictions powered by AI and real market data. Understand your worth and make informed career decisions.</div>", unsafe_allow_html=True)
+st.markdown(
+    "<div class='title'>Discover Your <span style='background:linear-gradient(90deg,#0072ff,#00c6ff); -webkit-background-clip:text; -webkit-text-fill-color:transparent'>Salary Potential</span></div>"
+    "<div class='subtitle'>Get accurate salary predictions powered by AI and real market data. Understand your worth and make informed career decisions.</div>",
+    unsafe_allow_html=True,
+)
 
 # ----------------------------
 # Session state: history
 # ----------------------------
 if "history" not in st.session_state:
-    st.session_state.history = []  # newest first
-
-# ----------------------------
-# Layout: form (left) and output (right)
-# ----------------------------
-col_left, col_right = st.columns([1.2, 0.9], gap="large")
-
-with col_left:
-    st.markdown("<div class='glass'>", unsafe_allow_html=True)
-    st.markdown("### Enter Candidate Details", unsafe_allow_html=True)
-
-    # We include ALL backend-required fields (defaults where appropriate)
-    with st.form("predict_form", clear_on_submit=False):
-        c1, c2 = st.columns(2)
-        with c1:
-            age = st.number_input("Age", min_value=15, max_value=100, value=25, step=1)
-            education = st.selectbox("Education Level", ["High School", "Bachelor's", "Master's", "PhD", "Other"], index=1)
-            gender = st.selectbox("Gender", ["Male", "Female", "Other", "Prefer not to say"], index=0)
-            experience_level = st.selectbox("Experience Level", ["junior", "mid", "senior"], index=0)  # you chose 'junior' default
-        with c2:
-            hours_per_week = st.slider("Hours per Week", min_value=1, max_value=100, value=40)
-            job_title = st.text_input("Job Title", value="Data Engineer")
-            marital_status = st.selectbox("Marital Status", ["Never Married", "Married", "Divorced", "Widowed", "Other"], index=0)
-            employment_type = st.selectbox("Employment Type", ["FT", "PT", "CT", "FL"], index=0)  # FT default
-
-        # Residence / company location — you requested India defaults
-        c3, c4 = st.columns(2)
-        with c3:
-            employee_residence = st.text_input("Employee Residence (Country)", value="India")
-        with c4:
-            company_location = st.text_input("Company Location (Country)", value="India")
-
-        # Other backend fields
-        remote_ratio = st.selectbox("Remote Ratio", [0, 25, 50, 75, 100], index=0, format_func=lambda x: f"{x}%")
-        company_size = st.selectbox("Company Size", ["S", "M", "L"], index=1, help="S=Small M=Medium L=Large")
-
-        submit = st.form_submit_button("Predict My Salary", help="Click to request prediction", use_container_width=True)
-
-    st.markdown("</div>", unsafe_allow_html=True)
-
-with col_right:
-    st.markdown("<div class='glass' style='text-align:center;'>", unsafe_allow_html=True)
-    st.markdown("<div style='display:flex; justify-content:center; align-items:center; flex-direction:column;'>", unsafe_allow_html=True)
-    st.markdown("<div style='width:64px; height:64px; border-radius:50%; background:linear-gradient(135deg,#0072ff,#00c6ff); display:flex; align-items:center; justify-content:center; box-shadow:0 8px 22px rgba(0,114,255,0.12); margin-bottom:10px;'><svg width='28' height='28' viewBox='0 0 24 24' fill='none' xmlns='http://www.w3.org/2000/svg'><path d='M3 17h4l5-9 5 7 4-11' stroke='white' stroke-width='1.6' stroke-linecap='round' stroke-linejoin='round' /></svg></div>", unsafe_allow_html=True)
-    st.markdown("<div style='font-weight:700; font-size:18px;'>Predicted Salary</div>", unsafe_allow_html=True)
-    output_area = st.empty()
-    range_area = st.empty()
-    st.markdown("</div></div>", unsafe_allow_html=True)
-
-    # profile summary
-    st.markdown("<div style='height:18px'></div>", unsafe_allow_html=True)
-    st.markdown("<div class='glass'>", unsafe_allow_html=True)
-    st.markdown("**Profile Summary**  \n<small class='small-muted'>Quick view of input</small>", unsafe_allow_html=True)
-    pcol1, pcol2 = st.columns(2)
-    with pcol1:
-        st.markdown(f"**Education**  \n{education}")
-        st.markdown(f"**Hours / wk**  \n{hours_per_week}")
-    with pcol2:
-        st.markdown(f"**Job Title**  \n{job_title}")
-        st.markdown(f"**Age**  \n{age}")
-    st.markdown("</div>", unsafe_allow_html=True)
+    st.session_state.history = deque(maxlen=8)  # newest first, bounded to what the panel shows
 
 # ----------------------------
 # API call helper
 # ----------------------------
+@st.cache_resource
+def get_session() -> requests.Session:
+    # one pooled keep-alive session per server process, so repeat submits skip the TLS handshake
+    session = requests.Session()
+    # headers are fixed for the process, so they are set once here instead of passed per call
+    session.headers.update({"Content-Type": "application/json"})
+    if API_KEY:
+        session.headers["x-api-key"] = API_KEY
+    adapter = HTTPAdapter(
+        pool_connections=2,
+        pool_maxsize=4,
+        # /predict has no side effects, so POST is retried too (urllib3 leaves it out by default);
+        # read=0 keeps a slow reply from being re-sent, so the 18s read timeout is the ceiling
+        max_retries=Retry(
+            total=2,
+            connect=2,
+            read=0,
+            backoff_factor=0.3,
+            status_forcelist=[502, 503, 504],
+            allowed_methods=frozenset(["HEAD", "GET", "POST"]),
+            # hand back the last 5xx response so call_predict can show the backend's error body
+            raise_on_status=False,
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
 def call_predict(payload: Dict[str, Any]) -> Dict[str, Any]:
     if not PREDICT_ENDPOINT:
-        raise RuntimeError("BACKEND_URL not configured. Set BACKEND_URL environment variable.")
+        raise RuntimeError("BACKEND_URL missing or invalid. Set BACKEND_URL to an http(s) URL.")
     try:
-        r = requests.post(PREDICT_ENDPOINT, json=payload, headers=HEADERS, timeout=18)
+        # orjson emits bytes directly; the session supplies the headers
+        # (connect, read): fail fast on an unreachable host, still allow a slow cold-start reply
+        r = get_session().post(PREDICT_ENDPOINT, data=orjson.dumps(payload), timeout=(3.0, 18.0))
     except requests.exceptions.RequestException as e:
         raise RuntimeError(f"Network error: {e}")
     if r.status_code == 200:
-        return r.json()
-    else:
-        # try to decode json error
-        try:
-            return {"__error__": True, "status": r.status_code, "body": r.json()}
-        except Exception:
-            return {"__error__": True, "status": r.status_code, "body": r.text}
-
-# ----------------------------
-# Trigger prediction when submitted
-# ----------------------------
-if submit:
-    # Assemble payload EXACTLY matching backend schema (12 fields)
-    payload = {
-        "age": float(age),
-        "gender": gender,
-        "education": education,
-        "marital_status": marital_status,
-        "experience_level": experience_level,
-        "employment_type": employment_type,
-        "job_title": job_title,
-        "hours_per_week": float(hours_per_week),
-        "employee_residence": employee_residence,
-        "company_location": company_location,
-        "remote_ratio": float(remote_ratio),
-        "company_size": company_size
-    }
-
-    # show spinner + small delay for UX
-    with st.spinner("Requesting prediction from SmartPay..."):
-        time.sleep(0.6)
-        try:
-            resp = call_predict(payload)
-            if resp.get("__error__"):
-                st.error(f"API Error {resp['status']}: {resp['body']}")
-            else:
-                # expected response model: {"predicted_salary_usd": float}
-                predicted = float(resp.get("predicted_salary_usd", resp.get("predicted_salary", 0.0)))
-                # optional tolerance range or derive if missing
-                low = resp.get("low") or resp.get("low_usd") or max(0.0, predicted * 0.85)
-                high = resp.get("high") or resp.get("high_usd") or predicted * 1.15
-
-                # record history
-                st.session_state.history.insert(0, {
-                    "ts": datetime.utcnow().isoformat(),
-                    "payload": payload,
-                    "predicted": predicted,
-                    "low": low,
-                    "high": high
-                })
-
-                # show gauge
-                fig = go.Figure(go.Indicator(
-                    mode="gauge+number",
-                    value=predicted,
-                    number={"prefix": "$", "valueformat": ",.0f"},
-                    title={"text": "Annual Salary (USD)", "font": {"size": 16}},
-                    gauge={
-                        "axis": {"range": [0, max(200000, high * 1.2)]},
-                        "bar": {"color": "#0072ff"},
-                        "steps": [
-                            {"range": [0, predicted * 0.6], "color": "#f4fbff"},
-                            {"range": [predicted * 0.6, predicted * 0.9], "color": "#e9f8ff"},
-                            {"range": [predicted * 0.9, predicted * 1.2], "color": "#dff7ff"}
-                        ],
+        return orjson.loads(r.content)
+    # raise instead of returning the error so cached_predict never memoizes a failure
+    body = r.content
+    try:
+        body = orjson.loads(body)
+    except orjson.JSONDecodeError:
+        body = body.decode("utf-8", "replace")
+    raise RuntimeError(f"API Error {r.status_code}: {body}")
+
+def warm_connection(session: requests.Session) -> None:
+    # wakes an idle Render instance and opens the keep-alive TLS connection the first /predict reuses
+    try:
+        session.get(f"{BACKEND_URL}/health", timeout=(3.0, 5.0))
+    except requests.exceptions.RequestException:
+        pass
+
+@st.cache_data(ttl=300, max_entries=128, show_spinner=False)
+def cached_predict(payload_key: Tuple[Tuple[str, Any], ...]) -> Dict[str, Any]:
+    # identical submissions within the TTL are served without a network round-trip
+    return call_predict(dict(payload_key))
+
+# ----------------------------
+# Gauge helper
+# ----------------------------
+# parts of the gauge that never depend on the prediction (plotly copies these, it never mutates them)
+GAUGE_NUMBER = {"prefix": "$", "valueformat": ",.0f"}
+GAUGE_TITLE = {"text": "Annual Salary (USD)", "font": {"size": 16}}
+GAUGE_BAR = {"color": "#0072ff"}
+GAUGE_MARGIN = {"t": 6, "b": 6, "l": 6, "r": 6}
+
+# cache_resource hands back the same Figure; cache_data would unpickle it, and that re-validates
+# every trace (slower than building it). st.plotly_chart only reads the figure, so never mutate it.
+@st.cache_resource(max_entries=64, show_spinner=False)
+def build_gauge(predicted: float, high: float):
+    # plotly is imported on first use so cold starts don't pay for it
+    import plotly.graph_objects as go
+    lo, mid, top = predicted * 0.6, predicted * 0.9, predicted * 1.2
+    axis_max = max(200000.0, high * 1.2)
+    return go.Figure(go.Indicator(
+        mode="gauge+number",
+        value=predicted,
+        number=GAUGE_NUMBER,
+        title=GAUGE_TITLE,
+        gauge={
+            "axis": {"range": [0, axis_max]},
+            "bar": GAUGE_BAR,
+            "steps": [
+                {"range": [0, lo], "color": "#f4fbff"},
+                {"range": [lo, mid], "color": "#e9f8ff"},
+                {"range": [mid, top], "color": "#dff7ff"}
+            ],
+        }
+    ), layout=go.Layout(margin=GAUGE_MARGIN, height=260))
+
+# warm once per browser session, while the user is still filling in the form
+if PREDICT_ENDPOINT and "_warmed" not in st.session_state:
+    st.session_state._warmed = True
+    threading.Thread(target=warm_connection, args=(get_session(),), daemon=True).start()
+
+# ----------------------------
+# History helper
+# ----------------------------
+def history_entry_html(item: Dict[str, Any]) -> str:
+    rows = "".join(f"<tr><td>{k}</td><td>{html.escape(str(v))}</td></tr>" for k, v in item["payload"].items())
+    return (
+        f"<details class='history-entry'><summary>${item['predicted']:,.0f} · "
+        f"{html.escape(item['payload']['job_title'])} · {item['ts_display']}</summary>"
+        f"<b>Inputs</b><table>{rows}</table>"
+        f"<b>Prediction</b><br>Predicted: ${item['predicted']:,.0f}<br>"
+        f"Range: ${float(item['low']):,.0f} - ${float(item['high']):,.0f}"
+        "</details>"
+    )
+
+# ----------------------------
+# Prediction fragment
+# ----------------------------
+# form, output and history rerun on their own; CSS, hero and footer are left untouched on submit
+@st.fragment
+def predict_fragment() -> None:
+    # ----------------------------
+    # Layout: form (left) and output (right)
+    # ----------------------------
+    col_left, col_right = st.columns([1.2, 0.9], gap="large")
+
+    with col_left:
+        st.markdown("<div class='glass'><h3>Enter Candidate Details</h3></div>", unsafe_allow_html=True)
+
+        # We include ALL backend-required fields (defaults where appropriate)
+        with st.form("predict_form", clear_on_submit=False):
+            c1, c2 = st.columns(2)
+            with c1:
+                # whole-number widgets; the backend's float fields accept the ints as sent, so no casts
+                age = st.number_input("Age", min_value=15, max_value=100, value=25, step=1)
+                education = st.selectbox("Education Level", ["High School", "Bachelor's", "Master's", "PhD", "Other"], index=1)
+                gender = st.selectbox("Gender", ["Male", "Female", "Other", "Prefer not to say"], index=0)
+                experience_level = st.selectbox("Experience Level", ["junior", "mid", "senior"], index=0)  # you chose 'junior' default
+            with c2:
+                hours_per_week = st.slider("Hours per Week", min_value=1, max_value=100, value=40)
+                job_title = st.text_input("Job Title", value="Data Engineer")
+                marital_status = st.selectbox("Marital Status", ["Never Married", "Married", "Divorced", "Widowed", "Other"], index=0)
+                employment_type = st.selectbox("Employment Type", ["FT", "PT", "CT", "FL"], index=0)  # FT default
+
+            # Residence / company location — you requested India defaults
+            c3, c4 = st.columns(2)
+            with c3:
+                employee_residence = st.text_input("Employee Residence (Country)", value="India")
+            with c4:
+                company_location = st.text_input("Company Location (Country)", value="India")
+
+            # Other backend fields
+            remote_ratio = st.selectbox("Remote Ratio", list(REMOTE_RATIO_LABELS), index=0, format_func=REMOTE_RATIO_LABELS.get)
+            company_size = st.selectbox("Company Size", ["S", "M", "L"], index=1, help="S=Small M=Medium L=Large")
+
+            submit = st.form_submit_button("Predict My Salary", help="Click to request prediction", use_container_width=True)
+
+    with col_right:
+        # salary card scaffolding in one element; only the placeholders below change after submit
+        st.markdown(
+            "<div class='glass' style='text-align:center;'>"
+            "<div style='display:flex; justify-content:center; align-items:center; flex-direction:column;'>"
+            "<div class='salary-icon'></div>"
+            "<div style='font-weight:700; font-size:18px;'>Predicted Salary</div>"
+            "</div></div>",
+            unsafe_allow_html=True,
+        )
+        output_area = st.empty()
+        range_area = st.empty()
+
+        # profile summary as a single element instead of a columns container plus two markdowns
+        st.markdown(
+            "<div style='height:18px'></div>"
+            "<div class='glass'><b>Profile Summary</b><br><small class='small-muted'>Quick view of input</small>"
+            "<div class='profile-grid'>"
+            f"<div><b>Education</b><br>{html.escape(education)}</div>"
+            f"<div><b>Job Title</b><br>{html.escape(job_title)}</div>"
+            f"<div><b>Hours / wk</b><br>{hours_per_week}</div>"
+            f"<div><b>Age</b><br>{age}</div>"
+            "</div></div>",
+            unsafe_allow_html=True,
+        )
+
+    # ----------------------------
+    # Trigger prediction when submitted
+    # ----------------------------
+    if submit:
+        # Assemble payload EXACTLY matching backend schema (12 fields)
+        payload = {
+            "age": age,
+            "gender": gender,
+            "education": education,
+            "marital_status": marital_status,
+            "experience_level": experience_level,
+            "employment_type": employment_type,
+            # only the free-text inputs can carry stray whitespace; selectbox/numeric values go in as-is
+            "job_title": job_title.strip(),
+            "hours_per_week": hours_per_week,
+            "employee_residence": employee_residence.strip(),
+            "company_location": company_location.strip(),
+            "remote_ratio": remote_ratio,
+            "company_size": company_size
+        }
+        # built once: st.cache_data hashes it as the cache key and cached_predict turns it back into the body
+        payload_key = tuple(sorted(payload.items()))
+
+        # blank text fields would only come back as a 422, so skip the round-trip
+        missing = [label for k, label in REQUIRED_TEXT_LABELS.items() if not payload[k]]
+        if missing:
+            st.warning(f"Please fill in: {', '.join(missing)}")
+        else:
+            with st.spinner("Requesting prediction from SmartPay..."):
+                try:
+                    resp = cached_predict(payload_key)
+                    # expected response model: {"predicted_salary_usd": float}
+                    predicted = float(resp.get("predicted_salary_usd", resp.get("predicted_salary", 0.0)))
+                    # optional tolerance range or derive if missing
+                    low = resp.get("low") or resp.get("low_usd") or max(0.0, predicted * 0.85)
+                    high = resp.get("high") or resp.get("high_usd") or predicted * 1.15
+
+                    # record history; the display timestamp is formatted once here, not on every rerun
+                    ts = time.time()
+                    entry = {
+                        "ts": ts,
+                        "ts_display": datetime.fromtimestamp(ts, timezone.utc).strftime("%b %d %Y • %I:%M %p"),
+                        "payload": payload,
+                        "predicted": predicted,
+                        "low": low,
+                        "high": high
+                    }
+                    # entries never change after insert, so their markup is built once here
+                    entry["html"] = history_entry_html(entry)
+                    st.session_state.history.appendleft(entry)
+
+                    # textual range & main value; kept with the gauge inputs so every later run can repaint both
+                    st.session_state.last_result = {
+                        "predicted": predicted,
+                        "high": float(high),
+                        "html": f"""
+                        <div style='text-align:center; padding-top:8px;'>
+                          <div class='salary-val'>${predicted:,.0f}</div>
+                          <div class='small-muted'>per year</div>
+                          <div style='margin-top:12px; color:#5f6f7b;'>Expected Range</div>
+                          <div style='font-weight:700; margin-top:6px;'>${float(low):,.0f} - ${float(high):,.0f}</div>
+                        </div>
+                    """,
                     }
-                ))
-                fig.update_layout(margin=dict(t=6, b=6, l=6, r=6), height=260)
-                output_area.plotly_chart(fig, use_container_width=True)
-
-                # textual range & main value
-                range_area.markdown(f"""
-                    <div style='text-align:center; padding-top:8px;'>
-                      <div class='salary-val'>${predicted:,.0f}</div>
-                      <div class='small-muted'>per year</div>
-                      <div style='margin-top:12px; color:#5f6f7b;'>Expected Range</div>
-                      <div style='font-weight:700; margin-top:6px;'>${float(low):,.0f} - ${float(high):,.0f}</div>
-                    </div>
-                """, unsafe_allow_html=True)
-
-        except Exception as ex:
-            st.error(f"Prediction request failed: {ex}")
-            if BACKEND_URL:
-                st.info(f"Check backend health: {BACKEND_URL}/health")
-
-# ----------------------------
-# Show recent predictions (history)
-# ----------------------------
-st.markdown("<div style='height:20px'></div>", unsafe_allow_html=True)
-st.markdown("<div class='glass'>", unsafe_allow_html=True)
-st.markdown("### Prediction History", unsafe_allow_html=True)
-if not st.session_state.history:
-    st.markdown("<div class='small-muted'>No predictions yet. Generate one from the form above.</div>", unsafe_allow_html=True)
-else:
-    for i, item in enumerate(st.session_state.history[:8]):
-        ts = datetime.fromisoformat(item["ts"]).strftime("%b %d %Y • %I:%M %p")
-        with st.expander(f"${item['predicted']:,.0f} · {item['payload']['job_title']} · {ts}", expanded=False):
-            st.write("**Inputs**")
-            st.json(item["payload"])
-            st.write("**Prediction**")
-            st.write(f"Predicted: ${item['predicted']:,.0f}")
-            st.write(f"Range: ${float(item['low']):,.0f} - ${float(item['high']):,.0f}")
-
-st.markdown("</div>", unsafe_allow_html=True)
+
+                except Exception as ex:
+                    st.error(f"Prediction request failed: {ex}")
+                    if BACKEND_URL:
+                        st.info(f"Check backend health: {BACKEND_URL}/health")
+
+    # paint the latest successful result, whether it is new or kept from an earlier run, so a plain
+    # rerun, a blank-field warning or a failed request leaves it on screen
+    last = st.session_state.get("last_result")
+    if last:
+        # cache_resource hit when the result was already shown; the gauge is read-only, so plotly.js
+        # can skip hover/drag handlers and the mode bar
+        output_area.plotly_chart(
+            build_gauge(last["predicted"], last["high"]),
+            use_container_width=True,
+            config={"staticPlot": True, "displayModeBar": False},
+        )
+        range_area.markdown(last["html"], unsafe_allow_html=True)
+
+    # ----------------------------
+    # Show recent predictions (history)
+    # ----------------------------
+    history_header = "<div style='height:20px'></div><div class='glass'><h3>Prediction History</h3>"
+    if not st.session_state.history:
+        # empty state is a single element
+        st.markdown(history_header + "<div class='small-muted'>No predictions yet. Generate one from the form above.</div></div>", unsafe_allow_html=True)
+    else:
+        # every entry in one element; <details> keeps each collapsible like an st.expander
+        entries = "".join(item["html"] for item in st.session_state.history)
+        st.markdown(history_header + entries + "</div>", unsafe_allow_html=True)
+
+predict_fragment()
 
 # ----------------------------
 # Footer
 # ----------------------------
-st.markdown("<div style='height:12px'></div>", unsafe_allow_html=True)
-st.markdown("<footer>SmartPay — Developed by <b>Yuvaraja P</b> | Final Year CSE (IoT), Paavai Engineering College</footer>", unsafe_allow_html=True)
+st.markdown("<div style='height:12px'></div><footer>SmartPay — Developed by <b>Yuvaraja P</b> | Final Year CSE (IoT), Paavai Engineering College</footer>", unsafe_allow_html=True)